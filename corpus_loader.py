@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Corpus loader
+Streaming akses ke tabel abstracts untuk rebuild index tanpa memuat seluruh
+corpus sebagai ORM object sekaligus
+"""
+
+import os
+from sqlalchemy import select
+from sqlalchemy.orm import defer
+
+from migrate_app import app, db, Abstract, DetectionBatch
+
+# Jumlah baris yang diambil per keyset query
+CORPUS_CHUNK_SIZE = int(os.getenv('CORPUS_CHUNK_SIZE', 500))
+
+
+def _corpus_statement(active_only=True):
+    """Build SELECT (id, abstract_text) ordered by id"""
+    stmt = select(Abstract.id, Abstract.abstract_text).order_by(Abstract.id)
+    if active_only:
+        stmt = stmt.where(Abstract.is_active.is_(True))
+    return stmt
+
+
+def iter_corpus_chunks(chunk_size=None, active_only=True):
+    """Yield lists of (id, abstract_text) tuples, chunk_size rows at a time
+
+    Each chunk is a keyset query (WHERE id > last_id ORDER BY id LIMIT n) that
+    is read completely before it is yielded, so no cursor stays open while the
+    caller processes it and only one chunk is held in memory. Must be called
+    inside an app context.
+    """
+    chunk_size = chunk_size or CORPUS_CHUNK_SIZE
+    last_id = 0
+
+    while True:
+        stmt = _corpus_statement(active_only).where(Abstract.id > last_id).limit(chunk_size)
+        chunk = [(row.id, row.abstract_text) for row in db.session.execute(stmt)]
+        if not chunk:
+            return
+
+        yield chunk
+
+        if len(chunk) < chunk_size:
+            return
+        last_id = chunk[-1][0]
+
+
+def iter_corpus(chunk_size=None, active_only=True):
+    """Yield (id, abstract_text) tuples one by one from the streamed corpus"""
+    for chunk in iter_corpus_chunks(chunk_size, active_only):
+        yield from chunk
+
+
+def build_corpus_index(vectorizer, chunk_size=None, active_only=True, preprocess=None):
+    """Fit an index builder on the streamed corpus
+
+    `vectorizer` must be a single-pass builder: its fit_transform() iterates
+    the texts exactly once and returns one row per text, e.g. sklearn's
+    TfidfVectorizer. Returns (abstract_ids, matrix) where abstract_ids[i] is
+    row i of matrix; raises ValueError if the row count does not match.
+    """
+    abstract_ids = []
+
+    def texts():
+        for abstract_id, text in iter_corpus(chunk_size, active_only):
+            abstract_ids.append(abstract_id)
+            yield preprocess(text) if preprocess else text
+
+    matrix = vectorizer.fit_transform(texts())
+    if len(abstract_ids) != matrix.shape[0]:
+        raise ValueError(
+            f"Index has {matrix.shape[0]} rows for {len(abstract_ids)} abstracts; "
+            "vectorizer must consume the corpus in a single pass"
+        )
+    return abstract_ids, matrix
+
+
+def abstract_list_query(active_only=True):
+    """Abstract query for list and dashboard views, without abstract_text"""
+    query = Abstract.query.options(defer(Abstract.abstract_text))
+    if active_only:
+        query = query.filter(Abstract.is_active.is_(True))
+    return query
+
+
+def batch_list_query():
+    """DetectionBatch query for list and dashboard views, without description"""
+    return DetectionBatch.query.options(defer(DetectionBatch.description))
+
+
+if __name__ == '__main__':
+    with app.app_context():
+        total = 0
+        for chunk in iter_corpus_chunks():
+            total += len(chunk)
+            print(f"📄 Loaded {total} abstracts...")
+        print(f"✅ Corpus streamed: {total} abstracts")
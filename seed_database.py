@@ -7,6 +7,7 @@ import sys
 import os
 from datetime import datetime, date
 import bcrypt
+from sqlalchemy.orm import load_only
 
 # Add src path untuk import modules
 sys.path.append(os.path.join(os.path.dirname(__file__)))
@@ -156,7 +157,7 @@ def create_sample_abstracts():
             
             for abstract_data in sample_abstracts:
                 # Check if abstract already exists
-                existing_abstract = Abstract.query.filter_by(title=abstract_data['title']).first()
+                existing_abstract = Abstract.query.options(load_only(Abstract.id)).filter_by(title=abstract_data['title']).first()
                 if existing_abstract:
                     print(f"✅ Abstract '{abstract_data['title'][:50]}...' already exists")
                     continue